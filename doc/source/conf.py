@@ -65,6 +65,7 @@ rst_epilog = '''
 .. _python-icalendar: https://icalendar.readthedocs.io
 .. _tzlocal: https://pypi.org/project/tzlocal/
 .. _requests-file: https://github.com/dashea/requests-file
+.. _orjson: https://github.com/ijl/orjson
 .. _Plex: https://www.plex.tv/
 .. _portalocker: https://portalocker.readthedocs.io
 .. _jsonpath-ng: https://github.com/h2non/jsonpath-ng
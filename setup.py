@@ -17,6 +17,7 @@ extras_require = {
     "Logind": ["dbus-python"],
     "ical": ["requests", "icalendar", "python-dateutil", "tzlocal!=3.0"],
     "localfiles": ["requests-file"],
+    "fastjson": ["orjson"],
     "logactivity": ["python-dateutil", "pytz"],
     "test": [
         "pytest",
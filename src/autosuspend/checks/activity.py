@@ -26,7 +26,7 @@ import warnings
 import psutil
 
 from . import Activity, Check, ConfigurationError, SevereCheckError, TemporaryCheckError
-from .util import CommandMixin, NetworkMixin
+from .util import CommandMixin, json_loads, lazy_checks, NetworkMixin
 from ..util.subprocess import raise_severe_if_command_not_found
 from ..util.systemd import LogindDBusException
 from ..util.xorg import list_sessions_logind, list_sessions_sockets, XorgSession
@@ -35,14 +35,16 @@ from ..util.xorg import list_sessions_logind, list_sessions_sockets, XorgSession
 if TYPE_CHECKING:
     from jsonpath_ng import JSONPath
 
-# isort: off
+__getattr__ = lazy_checks(
+    __package__,
+    {
+        "ActiveCalendarEvent": (".ical", "ActiveCalendarEvent"),
+        "XPath": (".xpath", "XPathActivity"),
+        "LogindSessionsIdle": (".systemd", "LogindSessionsIdle"),
+    },
+)
 
-with suppress(ModuleNotFoundError):
-    from .ical import ActiveCalendarEvent  # noqa
-with suppress(ModuleNotFoundError):
-    from .xpath import XPathActivity as XPath  # noqa
-with suppress(ModuleNotFoundError):
-    from .systemd import LogindSessionsIdle  # noqa
+# isort: off
 
 from .kodi import Kodi, KodiIdleTime  # noqa
 
@@ -615,7 +617,7 @@ class JsonPath(NetworkMixin, Activity):
         import requests.exceptions
 
         try:
-            reply = self.request().json()
+            reply = json_loads(self.request().content)
             matched = self._jsonpath.find(reply)
             if matched:
                 # shorten to avoid excessive logging output
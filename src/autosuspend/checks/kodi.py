@@ -1,22 +1,95 @@
 import configparser
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+import weakref
 
 from . import Activity, ConfigurationError, TemporaryCheckError
-from .util import NetworkMixin
+from .util import json_loads, NetworkMixin
 
 
-def _add_default_kodi_url(config: configparser.SectionProxy) -> None:
-    if "url" not in config:
-        config["url"] = "http://localhost:8080/jsonrpc"
+_JSON_CONTENT_TYPE = "application/json"
 
 
-class Kodi(NetworkMixin, Activity):
+class _KodiBatch(NetworkMixin):
+    """Combines the JSON-RPC requests of all checks for one Kodi instance.
+
+    Checks register their requests once and receive a ticket for them. The
+    first check asking for its result triggers a single batch request
+    containing all registered requests. The replies are then handed out once
+    per ticket. Asking again for an already handed out result triggers the
+    next batch request.
+    """
+
+    _default_url = "http://localhost:8080/jsonrpc"
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        NetworkMixin.__init__(self, url=url, content_type=_JSON_CONTENT_TYPE, **kwargs)
+        self._requests: List[Dict[str, Any]] = []
+        self._request_ids: Dict[str, int] = {}
+        self._tickets: List[int] = []
+        self._pending: Set[int] = set()
+        self._replies: Dict[int, Dict[str, Any]] = {}
+
+    def register(self, method: str, params: Optional[Dict[str, Any]] = None) -> int:
+        request: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            request["params"] = params
+
+        # identical requests of different checks are only sent once
+        key = json.dumps(request, sort_keys=True)
+        if key not in self._request_ids:
+            self._request_ids[key] = len(self._requests) + 1
+            self._requests.append({**request, "id": self._request_ids[key]})
+            self._data = json.dumps(self._requests).encode()
+
+        self._tickets.append(self._request_ids[key])
+        return len(self._tickets) - 1
+
+    def _fetch(self) -> None:
+        # forget the previous batch first so that its replies are not handed
+        # out again in case this request fails
+        self._pending = set()
+        self._replies = {}
+        replies = json_loads(self.request().content)
+        self._replies = {reply["id"]: reply for reply in replies}
+        self._pending = set(range(len(self._tickets)))
+
+    def result(self, ticket: int) -> Dict[str, Any]:
+        """Return the reply for the request of a ticket.
+
+        Raises:
+            KeyError, TypeError, json.JSONDecodeError:
+                in case the reply cannot be interpreted
+            TemporaryCheckError:
+                in case the request fails
+        """
+        if ticket not in self._pending:
+            self._fetch()
+        self._pending.discard(ticket)
+        return self._replies[self._tickets[ticket]]
+
+
+_BatchKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+# batches only live as long as checks use them
+_batches: "weakref.WeakValueDictionary[_BatchKey, _KodiBatch]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _batch_for(url: str, **kwargs: Any) -> _KodiBatch:
+    key = (url, tuple(sorted(kwargs.items())))
+    batch = _batches.get(key)
+    if batch is None:
+        batch = _KodiBatch(url, **kwargs)
+        _batches[key] = batch
+    return batch
+
+
+class Kodi(Activity):
     @classmethod
     def collect_init_args(cls, config: configparser.SectionProxy) -> Dict[str, Any]:
         try:
-            _add_default_kodi_url(config)
-            args = NetworkMixin.collect_init_args(config)
+            args = _KodiBatch.collect_init_args(config)
             args["suspend_while_paused"] = config.getboolean(
                 "suspend_while_paused", fallback=False
             )
@@ -31,24 +104,20 @@ class Kodi(NetworkMixin, Activity):
     def __init__(
         self, name: str, url: str, suspend_while_paused: bool = False, **kwargs: Any
     ) -> None:
+        Activity.__init__(self, name)
+        self._url = url
         self._suspend_while_paused = suspend_while_paused
+        self._batch = _batch_for(url, **kwargs)
         if self._suspend_while_paused:
-            request = url + (
-                '?request={"jsonrpc": "2.0", "id": 1, '
-                '"method": "XBMC.GetInfoBooleans",'
-                '"params": {"booleans": ["Player.Playing"]} }'
+            self._ticket = self._batch.register(
+                "XBMC.GetInfoBooleans", {"booleans": ["Player.Playing"]}
             )
         else:
-            request = url + (
-                '?request={"jsonrpc": "2.0", "id": 1, '
-                '"method": "Player.GetActivePlayers"}'
-            )
-        NetworkMixin.__init__(self, url=request, **kwargs)
-        Activity.__init__(self, name)
+            self._ticket = self._batch.register("Player.GetActivePlayers")
 
     def _safe_request_result(self) -> Dict:
         try:
-            return self.request().json()["result"]
+            return self._batch.result(self._ticket)["result"]
         except (KeyError, TypeError, json.JSONDecodeError) as error:
             raise TemporaryCheckError("Unable to get or parse Kodi state") from error
 
@@ -62,12 +131,11 @@ class Kodi(NetworkMixin, Activity):
             return "Kodi currently playing" if reply else None
 
 
-class KodiIdleTime(NetworkMixin, Activity):
+class KodiIdleTime(Activity):
     @classmethod
     def collect_init_args(cls, config: configparser.SectionProxy) -> Dict[str, Any]:
         try:
-            _add_default_kodi_url(config)
-            args = NetworkMixin.collect_init_args(config)
+            args = _KodiBatch.collect_init_args(config)
             args["idle_time"] = config.getint("idle_time", fallback=120)
             return args
         except ValueError as error:
@@ -78,19 +146,19 @@ class KodiIdleTime(NetworkMixin, Activity):
         return cls(name, **cls.collect_init_args(config))
 
     def __init__(self, name: str, url: str, idle_time: int, **kwargs: Any) -> None:
-        request = url + (
-            '?request={{"jsonrpc": "2.0", "id": 1, '
-            '"method": "XBMC.GetInfoBooleans",'
-            '"params": {{"booleans": ["System.IdleTime({})"]}}}}'.format(idle_time)
-        )
-        NetworkMixin.__init__(self, url=request, **kwargs)
         Activity.__init__(self, name)
+        self._url = url
         self._idle_time = idle_time
+        self._reply_key = f"System.IdleTime({idle_time})"
+        self._batch = _batch_for(url, **kwargs)
+        self._ticket = self._batch.register(
+            "XBMC.GetInfoBooleans", {"booleans": [self._reply_key]}
+        )
 
     def check(self) -> Optional[str]:
         try:
-            reply = self.request().json()
-            if not reply["result"]["System.IdleTime({})".format(self._idle_time)]:
+            reply = self._batch.result(self._ticket)
+            if not reply["result"][self._reply_key]:
                 return "Someone interacts with Kodi"
             else:
                 return None
@@ -1,7 +1,20 @@
 import configparser
 from datetime import datetime, timedelta, timezone
+import functools
+import logging
+import operator
 import re
-from typing import Dict, Iterable, Optional, Pattern, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 
 import dbus
 
@@ -9,60 +22,193 @@ from . import Activity, ConfigurationError, TemporaryCheckError, Wakeup
 from ..util.systemd import list_logind_sessions, LogindDBusException
 
 
-def next_timer_executions() -> Dict[str, datetime]:
-    bus = dbus.SystemBus()
+_logger = logging.getLogger(__name__)
+
+_SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+_TIMER_INTERFACE = "org.freedesktop.systemd1.Timer"
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+# unit names without any regular expression syntax, dots need to be escaped
+_LITERAL_UNIT_NAME = re.compile(r"(?:[A-Za-z0-9_@:-]|\\[.@:-])+", re.ASCII)
+# cleared once systemd turned out not to implement the ObjectManager interface
+_object_manager_supported = True
+
+
+def _timer_properties_from_object_manager(
+    bus: dbus.SystemBus,
+) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+    """Fetch the properties of all timers with a single DBus call."""
+    _logger.debug("Fetching timer properties using GetManagedObjects")
+    systemd = bus.get_object(_SYSTEMD_BUS_NAME, "/org/freedesktop/systemd1")
+    objects = systemd.GetManagedObjects(
+        dbus_interface="org.freedesktop.DBus.ObjectManager"
+    )
+    return [
+        (
+            interfaces["org.freedesktop.systemd1.Unit"]["Id"],
+            interfaces[_TIMER_INTERFACE],
+        )
+        for interfaces in objects.values()
+        if _TIMER_INTERFACE in interfaces
+    ]
+
 
-    systemd = bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
-    units = systemd.ListUnits(dbus_interface="org.freedesktop.systemd1.Manager")
+def _timer_properties_from_units(
+    bus: dbus.SystemBus,
+    patterns: Optional[Sequence[str]],
+) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+    """Fetch the properties of timers by querying each timer unit individually.
+
+    Args:
+        patterns:
+            if given, only timer units whose names match one of these glob
+            patterns are queried. Filtering is performed by systemd. Otherwise,
+            all timer units are queried.
+    """
+    systemd = bus.get_object(_SYSTEMD_BUS_NAME, "/org/freedesktop/systemd1")
+    if patterns:
+        _logger.debug("Fetching timer properties using ListUnitsByPatterns")
+        units = systemd.ListUnitsByPatterns(
+            [], patterns, dbus_interface="org.freedesktop.systemd1.Manager"
+        )
+    else:
+        _logger.debug("Fetching timer properties using ListUnits")
+        units = systemd.ListUnits(dbus_interface="org.freedesktop.systemd1.Manager")
     timers = [unit for unit in units if unit[0].endswith(".timer")]
 
-    result: Dict[str, datetime] = {}
+    result = []
     for timer in timers:
-        obj = bus.get_object("org.freedesktop.systemd1", timer[6])
+        obj = bus.get_object(_SYSTEMD_BUS_NAME, timer[6])
         properties_interface = dbus.Interface(obj, "org.freedesktop.DBus.Properties")
-        props = properties_interface.GetAll("org.freedesktop.systemd1.Timer")
+        result.append((timer[0], properties_interface.GetAll(_TIMER_INTERFACE)))
+    return result
 
-        next_time: Optional[datetime] = None
-        if props["NextElapseUSecRealtime"]:
-            next_time = datetime.fromtimestamp(
-                props["NextElapseUSecRealtime"] / 1000000,
-                tz=timezone.utc,
-            )
-        elif props["NextElapseUSecMonotonic"]:
-            next_time = datetime.now(tz=timezone.utc) + timedelta(
-                seconds=props["NextElapseUSecMonotonic"] / 1000000
-            )
 
-        if next_time:
-            result[str(timer[0])] = next_time
+def _timer_properties(
+    bus: dbus.SystemBus,
+    patterns: Optional[Sequence[str]],
+) -> Iterable[Tuple[str, Mapping[str, Any]]]:
+    global _object_manager_supported
+
+    if patterns:
+        return _timer_properties_from_units(bus, patterns)
+
+    if _object_manager_supported:
+        try:
+            return _timer_properties_from_object_manager(bus)
+        except dbus.exceptions.DBusException as error:
+            if error.get_dbus_name() not in (
+                "org.freedesktop.DBus.Error.UnknownMethod",
+                "org.freedesktop.DBus.Error.UnknownInterface",
+            ):
+                raise
+            _object_manager_supported = False
+
+    return _timer_properties_from_units(bus, None)
+
+
+def next_timer_executions(
+    patterns: Optional[Sequence[str]] = None,
+) -> Dict[str, datetime]:
+    """Determine the next execution times of systemd timers.
+
+    Args:
+        patterns:
+            if given, only consider timer units whose names match one of these
+            glob patterns. Matching is performed by systemd.
+    """
+    bus = dbus.SystemBus()
+
+    now = datetime.now(tz=timezone.utc)
+    result: Dict[str, datetime] = {}
+    for name, props in _timer_properties(bus, patterns):
+        realtime = int(props["NextElapseUSecRealtime"])
+        monotonic = int(props["NextElapseUSecMonotonic"])
+        if realtime:
+            result[name] = _EPOCH + timedelta(microseconds=realtime)
+        elif monotonic:
+            result[name] = now + timedelta(microseconds=monotonic)
 
     return result
 
 
+# Entries of previous iterations are never requested again and just need to be
+# evicted eventually. The size only has to cover the distinct patterns in use.
+@functools.lru_cache(maxsize=16)
+def _next_timer_executions_at(
+    timestamp: datetime, patterns: Optional[Tuple[str, ...]]
+) -> Mapping[str, datetime]:
+    """Share timer executions between all checks of one iteration.
+
+    All wakeup checks of a single iteration receive the same timestamp. Hence,
+    caching on it ensures that systemd is only queried once per iteration and
+    set of patterns, regardless of the number of configured
+    :class:`SystemdTimer` checks.
+    """
+    return next_timer_executions(patterns)
+
+
 class SystemdTimer(Wakeup):
     """Ensures that the system is active when some selected SystemD timers will run."""
 
     @classmethod
     def create(cls, name: str, config: configparser.SectionProxy) -> "SystemdTimer":
         try:
-            return cls(name, re.compile(config["match"]))
+            # unit names are restricted to ASCII characters
+            return cls(
+                name,
+                re.compile(config["match"], re.ASCII),
+                config.get("match_glob", None),
+                config.getboolean("fullmatch", fallback=False),
+            )
         except (re.error, ValueError, KeyError, TypeError) as error:
             raise ConfigurationError(str(error))
 
-    def __init__(self, name: str, match: Pattern) -> None:
+    def __init__(
+        self,
+        name: str,
+        match: Pattern,
+        match_glob: Optional[str] = None,
+        fullmatch: bool = False,
+    ) -> None:
         Wakeup.__init__(self, name)
         self._match = match
+        self._match_fn = self._literal_match_fn(match, fullmatch) or (
+            match.fullmatch if fullmatch else match.match
+        )
+        self._patterns = (match_glob,) if match_glob else None
 
-    def check(self, timestamp: datetime) -> Optional[datetime]:
-        executions = next_timer_executions()
-        matching_executions = [
-            next_run for name, next_run in executions.items() if self._match.match(name)
-        ]
-        try:
-            return min(matching_executions)
-        except ValueError:
+    @staticmethod
+    def _literal_match_fn(
+        match: Pattern, fullmatch: bool
+    ) -> Optional[Callable[[str], Any]]:
+        """Replace expressions that are plain unit names or prefixes.
+
+        Returns:
+            A string comparison with the same semantics as the expression or
+            ``None`` in case the expression is not a literal.
+        """
+        if match.flags & re.IGNORECASE:
             return None
 
+        pattern = match.pattern
+        is_prefix = pattern.endswith(".*")
+        if is_prefix:
+            pattern = pattern[:-2]
+        if not _LITERAL_UNIT_NAME.fullmatch(pattern):
+            return None
+        literal = re.sub(r"\\(.)", r"\1", pattern)
+
+        if fullmatch and not is_prefix:
+            return literal.__eq__
+        return operator.methodcaller("startswith", literal)
+
+    def check(self, timestamp: datetime) -> Optional[datetime]:
+        executions = _next_timer_executions_at(timestamp, self._patterns)
+        return min(
+            (next_run for name, next_run in executions.items() if self._match_fn(name)),
+            default=None,
+        )
+
 
 class LogindSessionsIdle(Activity):
     """Prevents suspending in case a logind session is marked not idle.
@@ -84,8 +230,8 @@ class LogindSessionsIdle(Activity):
 
     def __init__(self, name: str, types: Iterable[str], states: Iterable[str]) -> None:
         Activity.__init__(self, name)
-        self._types = types
-        self._states = states
+        self._types = frozenset(types)
+        self._states = frozenset(states)
 
     @staticmethod
     def _list_logind_sessions() -> Iterable[Tuple[str, dict]]:
@@ -1,6 +1,10 @@
 import configparser
 from contextlib import suppress
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import importlib
+import json
+import threading
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit
 
 from . import Check, ConfigurationError, SevereCheckError, TemporaryCheckError
 
@@ -9,6 +13,64 @@ if TYPE_CHECKING:
     import requests
     import requests.models
 
+_orjson_loads: Optional[Callable[[bytes], Any]]
+try:
+    import orjson
+
+    _orjson_loads = orjson.loads
+except ImportError:
+    _orjson_loads = None
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson as an optional speedup.
+
+    orjson rejects some documents the json module accepts, for instance ones
+    with a byte order mark, in UTF-16 or containing NaN. These are parsed
+    again with the json module.
+
+    Raises:
+        json.JSONDecodeError:
+            in case the document cannot be parsed
+    """
+    if _orjson_loads is not None:
+        with suppress(ValueError):
+            return _orjson_loads(data)
+    return json.loads(data)
+
+
+def lazy_checks(
+    package: str, checks: Mapping[str, Tuple[str, str]]
+) -> Callable[[str], Any]:
+    """Create a module ``__getattr__`` importing check classes on first access.
+
+    This way, the dependencies of checks are only imported in case the checks
+    are actually configured. If dependencies are missing, the checks appear to
+    be absent from the module.
+
+    Args:
+        package:
+            the package to resolve relative module names against
+        checks:
+            maps exposed check names to the module and class name providing
+            the respective check
+
+    Returns:
+        A function to use as the module ``__getattr__``.
+    """
+
+    def module_getattr(name: str) -> Any:
+        if name not in checks:
+            raise AttributeError(name)
+        module_name, class_name = checks[name]
+        try:
+            module = importlib.import_module(module_name, package)
+        except ModuleNotFoundError as error:
+            raise AttributeError(name) from error
+        return getattr(module, class_name)
+
+    return module_getattr
+
 
 class CommandMixin:
     """Mixin for configuring checks based on external commands."""
@@ -24,7 +86,40 @@ class CommandMixin:
         self._command = command
 
 
+_sessions: Dict[str, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _create_session() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    with suppress(ImportError):
+        from requests_file import FileAdapter
+
+        session.mount("file://", FileAdapter())
+
+    return session
+
+
+def _get_shared_session(host: str) -> "requests.Session":
+    """Return a session per host so that connections are kept alive and reused."""
+    with _sessions_lock:
+        if host not in _sessions:
+            _sessions[host] = _create_session()
+        return _sessions[host]
+
+
 class NetworkMixin:
+    # URL to use in case none is configured, ``None`` makes the URL mandatory
+    _default_url: Optional[str] = None
+
     @staticmethod
     def _ensure_credentials_consistent(args: Dict[str, Any]) -> None:
         if (args["username"] is None) != (args["password"] is None):
@@ -38,7 +133,9 @@ class NetworkMixin:
         try:
             args: Dict[str, Any] = {}
             args["timeout"] = config.getint("timeout", fallback=5)
-            args["url"] = config["url"]
+            args["url"] = config.get("url", fallback=cls._default_url)
+            if args["url"] is None:
+                raise ConfigurationError("Lacks 'url' config entry")
             args["username"] = config.get("username")
             args["password"] = config.get("password")
             cls._ensure_credentials_consistent(args)
@@ -59,31 +156,33 @@ class NetworkMixin:
         username: Optional[str] = None,
         password: Optional[str] = None,
         accept: Optional[str] = None,
+        data: Optional[bytes] = None,
+        content_type: Optional[str] = None,
     ) -> None:
         self._url = url
         self._timeout = timeout
         self._username = username
         self._password = password
         self._accept = accept
-
-    @staticmethod
-    def _create_session() -> "requests.Session":
-        import requests
-
-        session = requests.Session()
-
-        with suppress(ImportError):
-            from requests_file import FileAdapter
-
-            session.mount("file://", FileAdapter())
-
-        return session
+        self._data = data
+        self._content_type = content_type
 
     def _request_headers(self) -> Optional[Dict[str, str]]:
+        headers: Dict[str, str] = {}
         if self._accept:
-            return {"Accept": self._accept}
+            headers["Accept"] = self._accept
+        if self._content_type:
+            headers["Content-Type"] = self._content_type
+        return headers or None
+
+    def _send(
+        self, session: "requests.Session", **kwargs: Any
+    ) -> "requests.models.Response":
+        """Perform a GET request or a POST request in case data is configured."""
+        if self._data is None:
+            return session.get(self._url, **kwargs)
         else:
-            return None
+            return session.post(self._url, data=self._data, **kwargs)
 
     def _create_auth_from_failed_request(
         self, reply: "requests.models.Response"
@@ -107,19 +206,19 @@ class NetworkMixin:
         import requests
         import requests.exceptions
 
-        session = self._create_session()
+        session = _get_shared_session(urlsplit(self._url).netloc)
 
         try:
 
-            reply = session.get(
-                self._url, timeout=self._timeout, headers=self._request_headers()
+            reply = self._send(
+                session, timeout=self._timeout, headers=self._request_headers()
             )
 
             # replace reply with an authenticated version if credentials are
             # available and the server has requested authentication
             if self._username and self._password and reply.status_code == 401:
-                reply = session.get(
-                    self._url,
+                reply = self._send(
+                    session,
                     timeout=self._timeout,
                     auth=self._create_auth_from_failed_request(reply),
                     headers=self._request_headers(),
@@ -1,26 +1,27 @@
 import configparser  # noqa
-from contextlib import suppress
 from datetime import datetime, timedelta, timezone
+import os
 from pathlib import Path
+import re
+import shlex
+import shutil
 import subprocess
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from . import ConfigurationError, TemporaryCheckError, Wakeup
-from .util import CommandMixin
+from . import ConfigurationError, SevereCheckError, TemporaryCheckError, Wakeup
+from .util import CommandMixin, lazy_checks
 from ..util.subprocess import raise_severe_if_command_not_found
 
 
-# isort: off
-
-with suppress(ModuleNotFoundError):
-    from .ical import Calendar  # noqa
-with suppress(ModuleNotFoundError):
-    from .xpath import XPathWakeup as XPath  # noqa
-    from .xpath import XPathDeltaWakeup as XPathDelta  # noqa
-with suppress(ModuleNotFoundError):
-    from .systemd import SystemdTimer  # noqa
-
-# isort: on
+__getattr__ = lazy_checks(
+    __package__,
+    {
+        "Calendar": (".ical", "Calendar"),
+        "XPath": (".xpath", "XPathWakeup"),
+        "XPathDelta": (".xpath", "XPathDeltaWakeup"),
+        "SystemdTimer": (".systemd", "SystemdTimer"),
+    },
+)
 
 
 class File(Wakeup):
@@ -40,13 +41,30 @@ class File(Wakeup):
     def __init__(self, name: str, path: Path) -> None:
         Wakeup.__init__(self, name)
         self._path = path
+        # (inode, mtime in ns, ctime in ns, size) of the file and the wake up
+        # time parsed from it. The inode detects files replaced by renaming.
+        self._cache: Optional[Tuple[Tuple[int, int, int, int], datetime]] = None
 
     def check(self, timestamp: datetime) -> Optional[datetime]:
         try:
-            first_line = self._path.read_text().splitlines()[0]
-            return datetime.fromtimestamp(float(first_line.strip()), timezone.utc)
+            stat = os.stat(self._path)
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1]
+
+            fd = os.open(self._path, os.O_RDONLY)
+            try:
+                # a timestamp easily fits, even for large files without line breaks
+                content = os.read(fd, 128)
+            finally:
+                os.close(fd)
+            first_line = content.split(b"\n", 1)[0]
+            wakeup_at = datetime.fromtimestamp(float(first_line.strip()), timezone.utc)
+            self._cache = (key, wakeup_at)
+            return wakeup_at
         except FileNotFoundError:
             # this is ok
+            self._cache = None
             return None
         except (ValueError, IOError) as error:
             raise TemporaryCheckError(
@@ -54,6 +72,34 @@ class File(Wakeup):
             ) from error
 
 
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`*?\[\]{}~#\\\n]")
+# builtins of the shell that also exist as executables but behave differently
+_SHELL_BUILTINS = frozenset({"echo", "false", "kill", "printf", "pwd", "test", "true"})
+
+
+def _split_command(command: str) -> Optional[List[str]]:
+    """Split a command into arguments if it can be executed without a shell.
+
+    Returns:
+        The arguments or ``None`` in case the command requires a shell.
+    """
+    if _SHELL_SYNTAX.search(command):
+        return None
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+    # variable assignments and shell builtins require a shell
+    if (
+        not args
+        or "=" in args[0]
+        or args[0] in _SHELL_BUILTINS
+        or shutil.which(args[0]) is None
+    ):
+        return None
+    return args
+
+
 class Command(CommandMixin, Wakeup):
     """Determine wake up times based on an external command.
 
@@ -64,13 +110,18 @@ class Command(CommandMixin, Wakeup):
     def __init__(self, name: str, command: str) -> None:
         CommandMixin.__init__(self, command)
         Wakeup.__init__(self, name)
+        self._args = _split_command(command)
 
     def check(self, timestamp: datetime) -> Optional[datetime]:
         try:
-            output = subprocess.check_output(
-                self._command,
-                shell=True,  # noqa: S602
-            ).splitlines()[0]
+            if self._args is None:
+                output = subprocess.check_output(
+                    self._command,
+                    shell=True,  # noqa: S602
+                )
+            else:
+                output = subprocess.check_output(self._args)  # noqa: S603
+            output = output.split(b"\n", 1)[0]
             self.logger.debug(
                 "Command %s succeeded with output %s", self._command, output
             )
@@ -84,6 +135,10 @@ class Command(CommandMixin, Wakeup):
             raise TemporaryCheckError(
                 "Unable to call the configured command"
             ) from error
+        except FileNotFoundError as error:
+            raise SevereCheckError(
+                f"Command '{self._command}' does not exist"
+            ) from error
         except ValueError as error:
             raise TemporaryCheckError(
                 "Return value cannot be interpreted as a timestamp"
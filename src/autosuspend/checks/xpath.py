@@ -1,6 +1,7 @@
 import configparser
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Sequence
+import math
+from typing import Any, Callable, Dict, Optional, Sequence
 
 from lxml import etree  # noqa: S410 using safe parser
 from lxml.etree import XPath, XPathSyntaxError  # noqa: S410 our input
@@ -73,13 +74,31 @@ class XPathWakeup(XPathMixin, Wakeup):
         XPathMixin.__init__(self, **kwargs)
 
     def convert_result(self, result: str, timestamp: datetime) -> datetime:
-        return datetime.fromtimestamp(float(result), timezone.utc)
+        return self.convert_result_from_float(float(result), timestamp)
+
+    def convert_result_from_float(self, result: float, timestamp: datetime) -> datetime:
+        """Convert a numeric result to a wake up time.
+
+        The conversion must be monotonic so that the smallest result yields the
+        earliest wake up time.
+        """
+        return datetime.fromtimestamp(result, timezone.utc)
+
+    @staticmethod
+    def _parse_result(result: str) -> float:
+        value = float(result)
+        # min() is not reliable in the presence of nan
+        if not math.isfinite(value):
+            raise ValueError("{} is not a finite number".format(result))
+        return value
 
     def check(self, timestamp: datetime) -> Optional[datetime]:
         matches = self.evaluate()
         try:
             if matches:
-                return min(self.convert_result(m, timestamp) for m in matches)
+                return self.convert_result_from_float(
+                    min(self._parse_result(m) for m in matches), timestamp
+                )
             else:
                 return None
         except TypeError as error:
@@ -92,15 +111,17 @@ class XPathWakeup(XPathMixin, Wakeup):
 
 class XPathDeltaWakeup(XPathWakeup):
 
-    UNITS = [
-        "days",
-        "seconds",
-        "microseconds",
-        "milliseconds",
-        "minutes",
-        "hours",
-        "weeks",
-    ]
+    _DELTA_FACTORIES: Dict[str, Callable[[float], timedelta]] = {
+        "days": lambda value: timedelta(days=value),
+        "seconds": lambda value: timedelta(seconds=value),
+        "microseconds": lambda value: timedelta(microseconds=value),
+        "milliseconds": lambda value: timedelta(milliseconds=value),
+        "minutes": lambda value: timedelta(minutes=value),
+        "hours": lambda value: timedelta(hours=value),
+        "weeks": lambda value: timedelta(weeks=value),
+    }
+
+    UNITS = frozenset(_DELTA_FACTORIES)
 
     @classmethod
     def create(cls, name: str, config: configparser.SectionProxy) -> "XPathDeltaWakeup":
@@ -116,7 +137,7 @@ class XPathDeltaWakeup(XPathWakeup):
             raise ValueError("Unsupported unit")
         XPathWakeup.__init__(self, name, **kwargs)
         self._unit = unit
+        self._make_delta = self._DELTA_FACTORIES[unit]
 
-    def convert_result(self, result: str, timestamp: datetime) -> datetime:
-        kwargs = {self._unit: float(result)}
-        return timestamp + timedelta(**kwargs)
+    def convert_result_from_float(self, result: float, timestamp: datetime) -> datetime:
+        return timestamp + self._make_delta(result)
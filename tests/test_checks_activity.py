@@ -1,6 +1,7 @@
 from collections import namedtuple
 from datetime import timedelta, timezone
 from getpass import getuser
+import json
 from pathlib import Path
 import re
 import socket
@@ -902,20 +903,20 @@ class TestLogindSessionsIdle(CheckTest):
 
     def test_configure_defaults(self) -> None:
         check = LogindSessionsIdle.create("name", config_section())
-        assert check._types == ["tty", "x11", "wayland"]
-        assert check._states == ["active", "online"]
+        assert check._types == {"tty", "x11", "wayland"}
+        assert check._states == {"active", "online"}
 
     def test_configure_types(self) -> None:
         check = LogindSessionsIdle.create(
             "name", config_section({"types": "test, bla,foo"})
         )
-        assert check._types == ["test", "bla", "foo"]
+        assert check._types == {"test", "bla", "foo"}
 
     def test_configure_states(self) -> None:
         check = LogindSessionsIdle.create(
             "name", config_section({"states": "test, bla,foo"})
         )
-        assert check._states == ["test", "bla", "foo"]
+        assert check._states == {"test", "bla", "foo"}
 
     @pytest.mark.usefixtures("_logind_dbus_error")
     def test_dbus_error(self) -> None:
@@ -940,7 +941,7 @@ class TestJsonPath(CheckTest):
     @pytest.fixture()
     def json_get_mock(mocker: Any) -> Any:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"a": {"b": 42, "c": "ignore"}}
+        mock_reply.content = json.dumps({"a": {"b": 42, "c": "ignore"}}).encode()
         return mocker.patch("requests.Session.get", return_value=mock_reply)
 
     def test_matching(self, json_get_mock: Any) -> None:
@@ -953,7 +954,6 @@ class TestJsonPath(CheckTest):
         json_get_mock.assert_called_once_with(
             url, timeout=5, headers={"Accept": "application/json"}
         )
-        json_get_mock().json.assert_called_once()
 
     def test_filter_expressions_work(self, json_get_mock: Any) -> None:
         url = "nourl"
@@ -967,7 +967,6 @@ class TestJsonPath(CheckTest):
         json_get_mock.assert_called_once_with(
             url, timeout=5, headers={"Accept": "application/json"}
         )
-        json_get_mock().json.assert_called_once()
 
     def test_not_matching(self, json_get_mock: Any) -> None:
         url = "nourl"
@@ -979,7 +978,6 @@ class TestJsonPath(CheckTest):
         json_get_mock.assert_called_once_with(
             url, timeout=5, headers={"Accept": "application/json"}
         )
-        json_get_mock().json.assert_called_once()
 
     def test_network_errors_are_passed(
         self, datadir: Path, serve_protected: Callable[[Path], Tuple[str, str, str]]
@@ -1003,6 +1001,20 @@ class TestJsonPath(CheckTest):
                 jsonpath=parse("b"),
             ).check()
 
+    def test_byte_order_mark(self, datadir: Path, httpserver: HTTPServer) -> None:
+        httpserver.expect_request("/bom.json").respond_with_data(
+            (datadir / "bom.json").read_bytes(), content_type="application/json"
+        )
+        assert (
+            JsonPath(
+                name="name",
+                url=httpserver.url_for("/bom.json"),
+                timeout=5,
+                jsonpath=parse("a.b"),
+            ).check()
+            is not None
+        )
+
     def test_create(self) -> None:
         check: JsonPath = JsonPath.create(
             "name",
@@ -1,3 +1,4 @@
+import gc
 import json
 
 import pytest
@@ -11,75 +12,88 @@ from . import CheckTest
 from .utils import config_section
 
 
+@pytest.fixture(autouse=True)
+def _collect_garbage() -> None:
+    # checks of previous tests may be kept alive by reference cycles, for
+    # instance through exception tracebacks, and with them their batches
+    gc.collect()
+
+
 class TestKodi(CheckTest):
     def create_instance(self, name: str) -> Check:
         return Kodi(name, url="url", timeout=10)
 
     def test_playing(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": [{"playerid": 0, "type": "audio"}],
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": [{"playerid": 0, "type": "audio"}],
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert Kodi("foo", url="url", timeout=10).check() is not None
 
-        mock_reply.json.assert_called_once_with()
-
     def test_not_playing(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"id": 1, "jsonrpc": "2.0", "result": []}
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert Kodi("foo", url="url", timeout=10).check() is None
 
-        mock_reply.json.assert_called_once_with()
-
     def test_playing_suspend_while_paused(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": {"Player.Playing": True},
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": {"Player.Playing": True},
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert (
             Kodi("foo", url="url", timeout=10, suspend_while_paused=True).check()
             is not None
         )
 
-        mock_reply.json.assert_called_once_with()
-
     def test_not_playing_suspend_while_paused(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": {"Player.Playing": False},
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": {"Player.Playing": False},
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert (
             Kodi("foo", url="url", timeout=10, suspend_while_paused=True).check()
             is None
         )
 
-        mock_reply.json.assert_called_once_with()
-
     def test_assertion_no_result(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"id": 1, "jsonrpc": "2.0"}
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps([{"id": 1, "jsonrpc": "2.0"}]).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             Kodi("foo", url="url", timeout=10).check()
 
     def test_request_error(self, mocker: MockFixture) -> None:
         mocker.patch(
-            "requests.Session.get", side_effect=requests.exceptions.RequestException()
+            "requests.Session.post", side_effect=requests.exceptions.RequestException()
         )
 
         with pytest.raises(TemporaryCheckError):
@@ -87,8 +101,8 @@ class TestKodi(CheckTest):
 
     def test_json_error(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.side_effect = json.JSONDecodeError("test", "test", 42)
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = b"invalid"
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             Kodi("foo", url="url", timeout=10).check()
@@ -104,14 +118,40 @@ class TestKodi(CheckTest):
             ),
         )
 
-        assert check._url.startswith("anurl")
-        assert check._timeout == 12
+        assert check._url == "anurl"
+        assert check._batch._timeout == 12
         assert not check._suspend_while_paused
 
     def test_create_default_url(self) -> None:
         check = Kodi.create("name", config_section())
 
-        assert check._url.split("?")[0] == "http://localhost:8080/jsonrpc"
+        assert check._url == "http://localhost:8080/jsonrpc"
+
+    def test_create_keeps_config_untouched(self) -> None:
+        section = config_section()
+        Kodi.create("name", section)
+
+        assert "url" not in section
+
+    def test_sends_json_rpc_request(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_reply)
+
+        Kodi("foo", url="url", timeout=10).check()
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args[0][0] == "url"
+        assert json.loads(mock_post.call_args[1]["data"]) == [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "Player.GetActivePlayers",
+            }
+        ]
+        assert mock_post.call_args[1]["headers"]["Content-Type"] == "application/json"
 
     def test_create_timeout_no_number(self) -> None:
         with pytest.raises(ConfigurationError):
@@ -122,7 +162,7 @@ class TestKodi(CheckTest):
             "name", config_section({"url": "anurl", "suspend_while_paused": "True"})
         )
 
-        assert check._url.startswith("anurl")
+        assert check._url == "anurl"
         assert check._suspend_while_paused
 
 
@@ -135,14 +175,20 @@ class TestKodiIdleTime(CheckTest):
             "name", config_section({"url": "anurl", "timeout": "12", "idle_time": "42"})
         )
 
-        assert check._url.startswith("anurl")
-        assert check._timeout == 12
+        assert check._url == "anurl"
+        assert check._batch._timeout == 12
         assert check._idle_time == 42
 
     def test_create_default_url(self) -> None:
         check = KodiIdleTime.create("name", config_section())
 
-        assert check._url.split("?")[0] == "http://localhost:8080/jsonrpc"
+        assert check._url == "http://localhost:8080/jsonrpc"
+
+    def test_create_keeps_config_untouched(self) -> None:
+        section = config_section()
+        KodiIdleTime.create("name", section)
+
+        assert "url" not in section
 
     def test_create_timeout_no_number(self) -> None:
         with pytest.raises(ConfigurationError):
@@ -158,48 +204,60 @@ class TestKodiIdleTime(CheckTest):
 
     def test_no_result(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"id": 1, "jsonrpc": "2.0"}
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps([{"id": 1, "jsonrpc": "2.0"}]).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check()
 
     def test_result_is_list(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"id": 1, "jsonrpc": "2.0", "result": []}
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check()
 
     def test_result_no_entry(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {"id": 1, "jsonrpc": "2.0", "result": {}}
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": {}}]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check()
 
     def test_result_wrong_entry(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": {"narf": True},
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": {"narf": True},
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         with pytest.raises(TemporaryCheckError):
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check()
 
     def test_active(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": {"System.IdleTime(42)": False},
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": {"System.IdleTime(42)": False},
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert (
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check() is not None
@@ -207,19 +265,115 @@ class TestKodiIdleTime(CheckTest):
 
     def test_inactive(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
-        mock_reply.json.return_value = {
-            "id": 1,
-            "jsonrpc": "2.0",
-            "result": {"System.IdleTime(42)": True},
-        }
-        mocker.patch("requests.Session.get", return_value=mock_reply)
+        mock_reply.content = json.dumps(
+            [
+                {
+                    "id": 1,
+                    "jsonrpc": "2.0",
+                    "result": {"System.IdleTime(42)": True},
+                }
+            ]
+        ).encode()
+        mocker.patch("requests.Session.post", return_value=mock_reply)
 
         assert KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check() is None
 
     def test_request_error(self, mocker: MockFixture) -> None:
         mocker.patch(
-            "requests.Session.get", side_effect=requests.exceptions.RequestException()
+            "requests.Session.post", side_effect=requests.exceptions.RequestException()
         )
 
         with pytest.raises(TemporaryCheckError):
             KodiIdleTime("foo", url="url", timeout=10, idle_time=42).check()
+
+
+class TestBatching:
+    def test_combines_requests_of_checks(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [
+                {"id": 1, "jsonrpc": "2.0", "result": []},
+                {"id": 2, "jsonrpc": "2.0", "result": {"System.IdleTime(42)": False}},
+            ]
+        ).encode()
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_reply)
+
+        playing = Kodi("foo", url="url", timeout=10)
+        idle = KodiIdleTime("bar", url="url", timeout=10, idle_time=42)
+
+        assert playing.check() is None
+        assert idle.check() is not None
+        mock_post.assert_called_once()
+        assert [r["method"] for r in json.loads(mock_post.call_args[1]["data"])] == [
+            "Player.GetActivePlayers",
+            "XBMC.GetInfoBooleans",
+        ]
+
+    def test_fetches_again_in_next_iteration(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_reply)
+
+        first = Kodi("foo", url="url", timeout=10)
+        second = Kodi("bar", url="url", timeout=10)
+
+        first.check()
+        second.check()
+        assert mock_post.call_count == 1
+        first.check()
+        assert mock_post.call_count == 2
+        assert len(json.loads(mock_post.call_args[1]["data"])) == 1
+
+    def test_failing_fetch_drops_previous_replies(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [
+                {"id": 1, "jsonrpc": "2.0", "result": [{"playerid": 0}]},
+                {"id": 2, "jsonrpc": "2.0", "result": {"System.IdleTime(42)": False}},
+            ]
+        ).encode()
+        mocker.patch(
+            "requests.Session.post",
+            side_effect=[
+                mock_reply,
+                requests.exceptions.ConnectionError(),
+                requests.exceptions.ConnectionError(),
+            ],
+        )
+
+        playing = Kodi("foo", url="url", timeout=10)
+        idle = KodiIdleTime("bar", url="url", timeout=10, idle_time=42)
+
+        # first iteration ends after the first active check
+        assert playing.check() is not None
+
+        with pytest.raises(TemporaryCheckError):
+            playing.check()
+        with pytest.raises(TemporaryCheckError):
+            idle.check()
+
+    def test_releases_unused_batches(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_reply)
+
+        Kodi("foo", url="url", timeout=10, suspend_while_paused=True)
+        Kodi("bar", url="url", timeout=10).check()
+
+        assert len(json.loads(mock_post.call_args[1]["data"])) == 1
+
+    def test_separates_instances(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        mock_reply.content = json.dumps(
+            [{"id": 1, "jsonrpc": "2.0", "result": []}]
+        ).encode()
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_reply)
+
+        Kodi("foo", url="url", timeout=10).check()
+        Kodi("bar", url="other", timeout=10).check()
+
+        assert mock_post.call_count == 2
@@ -1,12 +1,19 @@
 from datetime import datetime, timedelta, timezone
+import logging
 import re
 from unittest.mock import Mock
 
+import dbus
+from freezegun import freeze_time
 import pytest
 from pytest_mock import MockFixture
 
 from autosuspend.checks import Check, ConfigurationError
-from autosuspend.checks.systemd import next_timer_executions, SystemdTimer
+from autosuspend.checks.systemd import (
+    _next_timer_executions_at,
+    next_timer_executions,
+    SystemdTimer,
+)
 
 from . import CheckTest
 from .utils import config_section
@@ -17,10 +24,134 @@ def test_next_timer_executions() -> None:
     assert next_timer_executions() is not None
 
 
+class TestNextTimerExecutions:
+    @staticmethod
+    @pytest.fixture()
+    def systemd(mocker: MockFixture) -> Mock:
+        mocker.patch("autosuspend.checks.systemd._object_manager_supported", True)
+        bus = mocker.patch("dbus.SystemBus").return_value
+        return bus.get_object.return_value
+
+    def test_uses_managed_objects(self, systemd: Mock) -> None:
+        systemd.GetManagedObjects.return_value = {
+            "/org/freedesktop/systemd1/unit/foo_2etimer": {
+                "org.freedesktop.systemd1.Unit": {"Id": "foo.timer"},
+                "org.freedesktop.systemd1.Timer": {
+                    "NextElapseUSecRealtime": 42000000,
+                    "NextElapseUSecMonotonic": 0,
+                },
+            },
+            "/org/freedesktop/systemd1/unit/foo_2eservice": {
+                "org.freedesktop.systemd1.Unit": {"Id": "foo.service"},
+            },
+        }
+
+        assert next_timer_executions() == {
+            "foo.timer": datetime.fromtimestamp(42, timezone.utc)
+        }
+        systemd.ListUnitsByPatterns.assert_not_called()
+
+    def test_handles_monotonic_and_unscheduled_timers(self, systemd: Mock) -> None:
+        systemd.GetManagedObjects.return_value = {
+            "/org/freedesktop/systemd1/unit/mono_2etimer": {
+                "org.freedesktop.systemd1.Unit": {"Id": "mono.timer"},
+                "org.freedesktop.systemd1.Timer": {
+                    "NextElapseUSecRealtime": 0,
+                    "NextElapseUSecMonotonic": 1500000,
+                },
+            },
+            "/org/freedesktop/systemd1/unit/never_2etimer": {
+                "org.freedesktop.systemd1.Unit": {"Id": "never.timer"},
+                "org.freedesktop.systemd1.Timer": {
+                    "NextElapseUSecRealtime": 0,
+                    "NextElapseUSecMonotonic": 0,
+                },
+            },
+        }
+
+        with freeze_time("2019-10-01 10:00:00"):
+            assert next_timer_executions() == {
+                "mono.timer": datetime(2019, 10, 1, 10, 0, 1, 500000, timezone.utc)
+            }
+
+    def test_falls_back_without_object_manager(
+        self, systemd: Mock, mocker: MockFixture
+    ) -> None:
+        systemd.GetManagedObjects.side_effect = dbus.exceptions.DBusException(
+            name="org.freedesktop.DBus.Error.UnknownMethod"
+        )
+        systemd.ListUnits.return_value = [
+            ("foo.timer", "", "", "", "", "", "/unit/foo_2etimer"),
+            ("foo.service", "", "", "", "", "", "/unit/foo_2eservice"),
+        ]
+        interface = mocker.patch("dbus.Interface").return_value
+        interface.GetAll.return_value = {
+            "NextElapseUSecRealtime": 42000000,
+            "NextElapseUSecMonotonic": 0,
+        }
+
+        assert next_timer_executions() == {
+            "foo.timer": datetime.fromtimestamp(42, timezone.utc)
+        }
+        interface.GetAll.assert_called_once_with("org.freedesktop.systemd1.Timer")
+        systemd.ListUnitsByPatterns.assert_not_called()
+
+    def test_remembers_missing_object_manager(
+        self, systemd: Mock, mocker: MockFixture
+    ) -> None:
+        systemd.GetManagedObjects.side_effect = dbus.exceptions.DBusException(
+            name="org.freedesktop.DBus.Error.UnknownInterface"
+        )
+        systemd.ListUnits.return_value = []
+        mocker.patch("dbus.Interface")
+
+        next_timer_executions()
+        next_timer_executions()
+
+        systemd.GetManagedObjects.assert_called_once()
+        assert systemd.ListUnits.call_count == 2
+
+    def test_logs_used_method(
+        self, systemd: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        systemd.GetManagedObjects.return_value = {}
+
+        with caplog.at_level(logging.DEBUG):
+            next_timer_executions()
+
+        assert "GetManagedObjects" in caplog.text
+        assert "ListUnitsByPatterns" not in caplog.text
+
+    def test_filters_by_patterns(self, systemd: Mock, mocker: MockFixture) -> None:
+        systemd.ListUnitsByPatterns.return_value = [
+            ("foo.timer", "", "", "", "", "", "/unit/foo_2etimer"),
+        ]
+        interface = mocker.patch("dbus.Interface").return_value
+        interface.GetAll.return_value = {
+            "NextElapseUSecRealtime": 42000000,
+            "NextElapseUSecMonotonic": 0,
+        }
+
+        assert next_timer_executions(["foo*"]) == {
+            "foo.timer": datetime.fromtimestamp(42, timezone.utc)
+        }
+        systemd.GetManagedObjects.assert_not_called()
+        assert systemd.ListUnitsByPatterns.call_args[0][1] == ["foo*"]
+
+    def test_propagates_other_dbus_errors(self, systemd: Mock) -> None:
+        systemd.GetManagedObjects.side_effect = dbus.exceptions.DBusException(
+            name="org.freedesktop.DBus.Error.AccessDenied"
+        )
+
+        with pytest.raises(dbus.exceptions.DBusException):
+            next_timer_executions()
+
+
 class TestSystemdTimer(CheckTest):
     @staticmethod
     @pytest.fixture()
     def next_timer_executions(mocker: MockFixture) -> Mock:
+        _next_timer_executions_at.cache_clear()
         return mocker.patch("autosuspend.checks.systemd.next_timer_executions")
 
     def create_instance(self, name: str) -> Check:
@@ -30,6 +161,29 @@ class TestSystemdTimer(CheckTest):
         with pytest.raises(ConfigurationError):
             SystemdTimer.create("somename", config_section({"match": "(.*"}))
 
+    def test_create_match_glob(self) -> None:
+        check = SystemdTimer.create(
+            "somename", config_section({"match": "foo.*", "match_glob": "foo*"})
+        )
+
+        assert check._patterns == ("foo*",)
+
+    def test_create_without_match_glob(self) -> None:
+        check = SystemdTimer.create("somename", config_section({"match": "foo.*"}))
+
+        assert check._patterns is None
+
+    def test_create_uses_ascii_patterns(self) -> None:
+        check = SystemdTimer.create("somename", config_section({"match": "foo"}))
+
+        assert check._match.flags & re.ASCII
+
+    def test_create_invalid_fullmatch(self) -> None:
+        with pytest.raises(ConfigurationError):
+            SystemdTimer.create(
+                "somename", config_section({"match": "foo", "fullmatch": "nope"})
+            )
+
     def test_create_raises_if_match_is_missing(self) -> None:
         with pytest.raises(ConfigurationError):
             SystemdTimer.create("somename", config_section())
@@ -63,3 +217,73 @@ class TestSystemdTimer(CheckTest):
         }
 
         assert SystemdTimer("foo", re.compile(".*")).check(now) is now
+
+    def test_queries_timers_once_per_timestamp(
+        self, next_timer_executions: Mock
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        next_timer_executions.return_value = {"matching": now}
+
+        assert SystemdTimer("foo", re.compile(".*")).check(now) is now
+        assert SystemdTimer("bar", re.compile(".*")).check(now) is now
+        next_timer_executions.assert_called_once_with(None)
+
+        later = now + timedelta(seconds=1)
+        SystemdTimer("foo", re.compile(".*")).check(later)
+        assert next_timer_executions.call_count == 2
+
+    def test_passes_glob_to_systemd(self, next_timer_executions: Mock) -> None:
+        now = datetime.now(timezone.utc)
+        next_timer_executions.return_value = {"foo.timer": now}
+
+        assert SystemdTimer("foo", re.compile("foo"), "foo*").check(now) is now
+        next_timer_executions.assert_called_once_with(("foo*",))
+
+    def test_matches_prefixes_by_default(self, next_timer_executions: Mock) -> None:
+        now = datetime.now(timezone.utc)
+        next_timer_executions.return_value = {"foo.timer": now}
+
+        assert SystemdTimer("foo", re.compile("foo")).check(now) is now
+
+    def test_fullmatch(self, next_timer_executions: Mock) -> None:
+        now = datetime.now(timezone.utc)
+        next_timer_executions.return_value = {"foo.timer": now}
+
+        check = SystemdTimer.create(
+            "somename", config_section({"match": "foo", "fullmatch": "true"})
+        )
+        assert check.check(now) is None
+        check = SystemdTimer.create(
+            "somename", config_section({"match": r"foo\.timer", "fullmatch": "true"})
+        )
+        assert check.check(now) is now
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["foo", r"foo\.timer", "foo.*", "foo-bar@1.*", "fo+", "foo.timer", r"foo\.*"],
+    )
+    @pytest.mark.parametrize("fullmatch", [False, True])
+    @pytest.mark.parametrize(
+        "unit", ["foo.timer", "foo", "foo-bar@1.timer", "fooXtimer", "bar.timer"]
+    )
+    def test_match_semantics_are_preserved(
+        self, pattern: str, fullmatch: bool, unit: str
+    ) -> None:
+        match = re.compile(pattern, re.ASCII)
+        reference = match.fullmatch if fullmatch else match.match
+
+        check = SystemdTimer("foo", match, fullmatch=fullmatch)
+
+        assert bool(check._match_fn(unit)) == bool(reference(unit))
+
+    @pytest.mark.parametrize("pattern", ["foo", r"foo\.timer", "foo.*"])
+    def test_literals_avoid_regular_expressions(self, pattern: str) -> None:
+        match = re.compile(pattern)
+
+        assert SystemdTimer("foo", match)._match_fn != match.match
+        assert SystemdTimer("foo", match, fullmatch=True)._match_fn != match.fullmatch
+
+    def test_ignore_case_uses_regular_expressions(self) -> None:
+        match = re.compile("foo", re.IGNORECASE)
+
+        assert SystemdTimer("foo", match)._match_fn == match.match
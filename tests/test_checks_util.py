@@ -1,3 +1,6 @@
+import codecs
+import json
+import math
 from pathlib import Path
 from typing import Callable, Optional, Tuple
 from unittest.mock import ANY
@@ -8,7 +11,7 @@ from pytest_mock import MockFixture
 import requests
 
 from autosuspend.checks import Activity, ConfigurationError, TemporaryCheckError
-from autosuspend.checks.util import CommandMixin, NetworkMixin
+from autosuspend.checks.util import CommandMixin, json_loads, lazy_checks, NetworkMixin
 
 from .utils import config_section
 
@@ -36,6 +39,47 @@ class TestCommandMixin:
             _CommandMixinSub.create("name", config_section())
 
 
+class TestLazyChecks:
+    def test_imports_check(self) -> None:
+        module_getattr = lazy_checks(
+            "autosuspend.checks", {"Foo": (".util", "CommandMixin")}
+        )
+        assert module_getattr("Foo") is CommandMixin
+
+    def test_unknown_name(self) -> None:
+        module_getattr = lazy_checks("autosuspend.checks", {})
+        with pytest.raises(AttributeError):
+            module_getattr("Foo")
+
+    def test_missing_module(self) -> None:
+        module_getattr = lazy_checks(
+            "autosuspend.checks", {"Foo": (".doesnotexist", "Foo")}
+        )
+        with pytest.raises(AttributeError):
+            module_getattr("Foo")
+
+
+class TestJsonLoads:
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b'{"a": 42}', {"a": 42}),
+            (codecs.BOM_UTF8 + b'{"a": 42}', {"a": 42}),
+            ('{"a": 42}'.encode("utf-16"), {"a": 42}),
+            (b'{"a": 18446744073709551616}', {"a": 18446744073709551616}),
+        ],
+    )
+    def test_parses(self, data: bytes, expected: dict) -> None:
+        assert json_loads(data) == expected
+
+    def test_nan(self) -> None:
+        assert math.isnan(json_loads(b"[NaN]")[0])
+
+    def test_invalid(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"{")
+
+
 class TestNetworkMixin:
     def test_collect_missing_url(self) -> None:
         with pytest.raises(ConfigurationError, match=r"^Lacks 'url'.*"):
@@ -122,3 +166,25 @@ class TestNetworkMixin:
         mock_method.assert_called_with(
             ANY, timeout=ANY, headers={"Accept": content_type}
         )
+
+    def test_post_data(self, mocker: MockFixture) -> None:
+        mock_method = mocker.patch("requests.Session.post")
+
+        NetworkMixin(
+            "url", timeout=5, data=b"payload", content_type="foo/bar"
+        ).request()
+
+        mock_method.assert_called_with(
+            "url", data=b"payload", timeout=ANY, headers={"Content-Type": "foo/bar"}
+        )
+
+    def test_shares_sessions_per_host(self, mocker: MockFixture) -> None:
+        mock_method = mocker.patch("requests.Session.get", autospec=True)
+
+        NetworkMixin("http://host/a", timeout=5).request()
+        NetworkMixin("http://host/b", timeout=5).request()
+        NetworkMixin("http://other/a", timeout=5).request()
+
+        sessions = [call[0][0] for call in mock_method.call_args_list]
+        assert sessions[0] is sessions[1]
+        assert sessions[0] is not sessions[2]
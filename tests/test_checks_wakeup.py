@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+import os
 from pathlib import Path
 import subprocess
 
@@ -49,10 +50,53 @@ class TestFile(CheckTest):
     def test_handle_io_error(self, tmp_path: Path, mocker: MockFixture) -> None:
         file_path = tmp_path / "test"
         file_path.write_bytes(b"2314898")
-        mocker.patch("pathlib.Path.read_text").side_effect = IOError
+        mocker.patch("os.read").side_effect = IOError
         with pytest.raises(TemporaryCheckError):
             File("name", file_path).check(datetime.now(timezone.utc))
 
+    def test_reuses_result_of_unchanged_file(
+        self, tmp_path: Path, mocker: MockFixture
+    ) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("42\n")
+        check = File("name", test_file)
+        check.check(datetime.now(timezone.utc))
+
+        mocker.patch("os.read").side_effect = IOError
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            42, timezone.utc
+        )
+
+    def test_rereads_changed_file(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("42\n")
+        check = File("name", test_file)
+        check.check(datetime.now(timezone.utc))
+
+        test_file.write_text("4242\n")
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            4242, timezone.utc
+        )
+
+        # atomic replacement with the same size and modification time
+        stat = test_file.stat()
+        replacement = tmp_path / "replacement"
+        replacement.write_text("4343\n")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        replacement.rename(test_file)
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            4343, timezone.utc
+        )
+
+        test_file.unlink()
+        assert check.check(datetime.now(timezone.utc)) is None
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("")
+        with pytest.raises(TemporaryCheckError):
+            File("name", test_file).check(datetime.now(timezone.utc))
+
     def test_invalid_number(self, tmp_path: Path) -> None:
         test_file = tmp_path / "filexxx"
         test_file.write_text("nonumber\n\n")
@@ -81,7 +125,7 @@ class TestCommand(CheckTest):
 
     def test_multiple_lines(self, mocker: MockFixture) -> None:
         mock = mocker.patch("subprocess.check_output")
-        mock.return_value = "1234\nignore\n"
+        mock.return_value = b"1234\nignore\n"
         check = Command("test", "echo bla")
         assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
             1234, timezone.utc
@@ -89,7 +133,7 @@ class TestCommand(CheckTest):
 
     def test_multiple_lines_but_empty(self, mocker: MockFixture) -> None:
         mock = mocker.patch("subprocess.check_output")
-        mock.return_value = "   \nignore\n"
+        mock.return_value = b"   \nignore\n"
         check = Command("test", "echo bla")
         assert check.check(datetime.now(timezone.utc)) is None
 
@@ -105,6 +149,43 @@ class TestCommand(CheckTest):
         with pytest.raises(SevereCheckError):
             check.check(datetime.now(timezone.utc))
 
+    def test_executable_vanished(self, mocker: MockFixture) -> None:
+        check = Command("test", "echo 1234")
+        mocker.patch("subprocess.check_output").side_effect = FileNotFoundError
+        with pytest.raises(SevereCheckError):
+            check.check(datetime.now(timezone.utc))
+
+    def test_simple_command_without_shell(self, mocker: MockFixture) -> None:
+        mock = mocker.patch("subprocess.check_output")
+        mock.return_value = b"1234\n"
+        Command("test", "date '+%s %N'").check(datetime.now(timezone.utc))
+        mock.assert_called_once_with(["date", "+%s %N"])
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "date | cat",
+            "cat $HOME",
+            "FOO=1 date",
+            "cd /tmp",
+            "cat 'bla",
+            "cat bla\\ blubb",
+            "echo 1234",
+            "printf 1234",
+        ],
+    )
+    def test_shell_syntax_uses_shell(self, mocker: MockFixture, command: str) -> None:
+        mock = mocker.patch("subprocess.check_output")
+        mock.return_value = b"1234\n"
+        Command("test", command).check(datetime.now(timezone.utc))
+        mock.assert_called_once_with(command, shell=True)
+
+    def test_pipeline(self) -> None:
+        check = Command("test", "echo 1234 | cat")
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            1234, timezone.utc
+        )
+
 
 class TestPeriodic(CheckTest):
     def create_instance(self, name: str) -> Check:
@@ -204,6 +204,23 @@ class TestXPathWakeup(CheckTest):
                 datetime.now(timezone.utc)
             )
 
+    @pytest.mark.parametrize(
+        "values", [("nan", "10"), ("10", "nan"), ("10", "inf"), ("-inf", "10")]
+    )
+    def test_not_finite(self, mocker: MockFixture, values: Tuple[str, str]) -> None:
+        mock_reply = mocker.MagicMock()
+        content_property = mocker.PropertyMock()
+        type(mock_reply).content = content_property
+        content_property.return_value = "<root>{}</root>".format(
+            "".join('<a value="{}"></a>'.format(v) for v in values)
+        )
+        mocker.patch("requests.Session.get", return_value=mock_reply)
+
+        with pytest.raises(TemporaryCheckError):
+            XPathWakeup("foo", xpath="//a/@value", url="nourl", timeout=5).check(
+                datetime.now(timezone.utc)
+            )
+
     def test_multiple_min(self, mocker: MockFixture) -> None:
         mock_reply = mocker.MagicMock()
         content_property = mocker.PropertyMock()
@@ -265,6 +282,25 @@ class TestXPathDeltaWakeup(CheckTest):
         ).check(now)
         assert result == now + timedelta(seconds=42) * factor
 
+    def test_multiple_min(self, mocker: MockFixture) -> None:
+        mock_reply = mocker.MagicMock()
+        content_property = mocker.PropertyMock()
+        type(mock_reply).content = content_property
+        content_property.return_value = """
+            <root>
+                <a value="40"></a>
+                <a value="-10"></a>
+                <a value="20"></a>
+            </root>
+        """
+        mocker.patch("requests.Session.get", return_value=mock_reply)
+
+        now = datetime.now(timezone.utc)
+        result = XPathDeltaWakeup(
+            "foo", xpath="//a/@value", url="nourl", timeout=5, unit="minutes"
+        ).check(now)
+        assert result == now - timedelta(minutes=10)
+
     def test_create(self) -> None:
         check = XPathDeltaWakeup.create(
             "name",